@@ -32,9 +32,9 @@ def _find_compcor(confounds_json, compcor, n_compcor, acompcor_combined):
 
 def _select_compcor(compcor_cols, n_compcor):
     """Retain a specified number of compcor components."""
-    # only select if not "auto", or less components are requested than there actually is
-    if (n_compcor != "auto") and (n_compcor < len(compcor_cols)):
-        compcor_cols = compcor_cols[0:n_compcor]
+    # only select if not "auto", slicing keeps all components if fewer are available
+    if n_compcor != "auto":
+        compcor_cols = compcor_cols[:n_compcor]
     return compcor_cols
 
 
@@ -63,18 +63,13 @@ def _acompcor_mask(confounds_json, anat_mask, compcor_cols_filt, n_compcor):
 
 def _json_mask(compcor_cols_filt, confounds_json, mask):
     """Extract anat compcor components from a given mask."""
-    cols = []
-    for compcor_col in compcor_cols_filt:
-        if confounds_json[compcor_col]["Mask"] in mask:
-            cols.append(compcor_col)
-    return cols
+    return [col for col in compcor_cols_filt if confounds_json[col]["Mask"] in mask]
 
 
 def _prefix_confound_filter(prefix, all_compcor_name):
     """Get confound columns by prefix and acompcor mask."""
-    compcor_cols_filt = []
-    for nn in range(len(all_compcor_name)):
-        nn_str = str(nn).zfill(2)
-        compcor_col = f"{prefix}_comp_cor_{nn_str}"
-        compcor_cols_filt.append(compcor_col)
-    return compcor_cols_filt
+    # components are zero-padded to two digits only, so sort them numerically
+    return sorted(
+        (comp for comp in all_compcor_name if comp.startswith(f"{prefix}_comp_cor_")),
+        key=lambda comp: int(comp.rsplit("_", 1)[-1]),
+    )
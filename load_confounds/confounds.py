@@ -5,18 +5,36 @@ Authors: load_confounds team
 import numpy as np
 import pandas as pd
 from sklearn.decomposition import PCA
-from sklearn.preprocessing import scale
 import warnings
 import os
+import re
 import json
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Suffixes of the expansion terms for each confound model
+suffix_models = {
+    "basic": (),
+    "derivatives": ("derivative1",),
+    "power2": ("power2",),
+    "full": ("derivative1", "power2", "derivative1_power2"),
+}
 
 
 def _check_params(confounds_raw, params):
     """Check that specified parameters can be found in the confounds."""
-    not_found_params = []
-    for par in params:
-        if not par in confounds_raw.columns:
-            not_found_params.append(par)
+    columns = set(confounds_raw.columns)
+    not_found_params = [par for par in params if par not in columns]
     if not_found_params:
         raise MissingConfound(params=not_found_params)
     return None
@@ -24,14 +42,11 @@ def _check_params(confounds_raw, params):
 
 def _find_confounds(confounds_raw, keywords):
     """Find confounds that contain certain keywords."""
-    list_confounds = []
-    missing_keys = []
-    for key in keywords:
-        key_found = [col for col in confounds_raw.columns if key in col]
-        if not key_found:
-            missing_keys.append(key)
-        else:
-            list_confounds.extend(key_found)
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    list_confounds = [col for col in confounds_raw.columns if pattern.search(col)]
+    missing_keys = [
+        key for key in keywords if not any(key in col for col in list_confounds)
+    ]
     if missing_keys:
         raise MissingConfound(keywords=missing_keys)
     return list_confounds
@@ -55,17 +70,8 @@ def _add_suffix(params, model):
     Add suffixes to a list of parameters.
     Suffixes includes derivatives, power2 and full
     """
-    params_full = params.copy()
-    suffix = {
-        "basic": {},
-        "derivatives": {"derivative1"},
-        "power2": {"power2"},
-        "full": {"derivative1", "power2", "derivative1_power2"},
-    }
-    for par in params:
-        for suff in suffix[model]:
-            params_full.append(f"{par}_{suff}")
-    return params_full
+    suffixes = suffix_models[model]
+    return list(params) + [f"{par}_{suff}" for par in params for suff in suffixes]
 
 
 def _pca_motion(confounds_motion, n_components):
@@ -75,14 +81,30 @@ def _pca_motion(confounds_motion, n_components):
         raise ValueError(
             f"User requested n_motion={n_components} motion components, but found only {n_available}."
         )
-    confounds_motion = confounds_motion.dropna()
-    confounds_motion_std = scale(
-        confounds_motion, axis=0, with_mean=True, with_std=True
+    # float32 is more than enough precision for head motion estimates
+    confounds_motion = np.asarray(confounds_motion, dtype=np.float32)
+    # Fit the PCA on time points without NaN, i.e. skip the first one with derivatives
+    mask_valid = ~np.isnan(confounds_motion).any(axis=1)
+    # Standardize with numpy: sklearn's scale warns about float32 rounding errors
+    confounds_motion_std = confounds_motion[mask_valid]
+    confounds_motion_std -= confounds_motion_std.mean(axis=0)
+    std = confounds_motion_std.std(axis=0)
+    std[std == 0] = 1
+    confounds_motion_std /= std
+    # A fractional n_components (explained variance) requires the full solver,
+    # otherwise only estimate the requested top components
+    if n_components < 1:
+        pca = PCA(n_components=n_components, svd_solver="full")
+    else:
+        pca = PCA(n_components=n_components, svd_solver="randomized", random_state=0)
+    components = pca.fit_transform(confounds_motion_std)
+    # Keep one row per time point, dropped time points are left as NaN
+    motion_pca = np.full(
+        (len(confounds_motion), components.shape[1]), np.nan, dtype=np.float32
     )
-    pca = PCA(n_components=n_components)
-    motion_pca = pd.DataFrame(pca.fit_transform(confounds_motion_std))
-    motion_pca.columns = ["motion_pca_" + str(col + 1) for col in motion_pca.columns]
-    return motion_pca
+    motion_pca[mask_valid] = components
+    labels = ["motion_pca_" + str(col + 1) for col in range(components.shape[1])]
+    return motion_pca, labels
 
 
 def _optimize_scrub(fd_outliers, n_scans):
@@ -92,82 +114,180 @@ def _optimize_scrub(fd_outliers, n_scans):
     Power, Jonathan D., et al. "Methods to detect, characterize, and remove
     motion artifact in resting state fMRI." Neuroimage 84 (2014): 320-341.
     """
+    if njit is None:
+        return _optimize_scrub_np(fd_outliers, n_scans)
+    return _optimize_scrub_nb(np.asarray(fd_outliers, dtype=np.int64), n_scans)
+
+
+def _optimize_scrub_loop(fd_outliers, n_scans):
+    """Optimized scrub walking through sorted outliers, compiled with numba."""
+    scrubbed = np.empty(n_scans, dtype=np.int64)
+    count = 0
+    # Start by checking if the beginning continuous segment is fewer than 5 volumes
+    if fd_outliers[0] < 5:
+        for ind in range(fd_outliers[0]):
+            scrubbed[count] = ind
+            count += 1
+    # Now do everything in between
+    for ii in range(len(fd_outliers)):
+        scrubbed[count] = fd_outliers[ii]
+        count += 1
+        if ii + 1 < len(fd_outliers):
+            gap = fd_outliers[ii + 1] - fd_outliers[ii]
+            if 1 < gap < 6:
+                for ind in range(fd_outliers[ii] + 1, fd_outliers[ii + 1]):
+                    scrubbed[count] = ind
+                    count += 1
+    # Do the same for the ending segment of scans
+    if n_scans - (fd_outliers[-1] + 1) < 5:
+        for ind in range(fd_outliers[-1] + 1, n_scans):
+            scrubbed[count] = ind
+            count += 1
+    return scrubbed[:count]
+
+
+if njit is not None:
+    _optimize_scrub_nb = njit(cache=True)(_optimize_scrub_loop)
+
+
+def _optimize_scrub_np(fd_outliers, n_scans):
+    """Optimized scrub with vectorized NumPy operations."""
     # Start by checking if the beginning continuous segment is fewer than 5 volumes
     if fd_outliers[0] < 5:
-        fd_outliers = np.asarray(list(range(fd_outliers[0])) + list(fd_outliers))
+        fd_outliers = np.concatenate((np.arange(fd_outliers[0]), fd_outliers))
     # Do the same for the ending segment of scans
     if n_scans - (fd_outliers[-1] + 1) < 5:
-        fd_outliers = np.asarray(
-            list(fd_outliers) + list(range(fd_outliers[-1], n_scans))
+        fd_outliers = np.concatenate(
+            (fd_outliers, np.arange(fd_outliers[-1] + 1, n_scans))
         )
     # Now do everything in between
     fd_outlier_ind_diffs = np.diff(fd_outliers)
     short_segments_inds = np.where(
         np.logical_and(fd_outlier_ind_diffs > 1, fd_outlier_ind_diffs < 6)
     )[0]
-    for ind in short_segments_inds:
-        fd_outliers = np.asarray(
-            list(fd_outliers) + list(range(fd_outliers[ind] + 1, fd_outliers[ind + 1]))
-        )
-    fd_outliers = np.sort(np.unique(fd_outliers))
+    # Fill all short segments at once: each gap starts right after an outlier,
+    # and offsets restart from zero within each gap
+    gap_lens = fd_outlier_ind_diffs[short_segments_inds] - 1
+    gap_starts = fd_outliers[short_segments_inds] + 1
+    gap_offsets = np.arange(gap_lens.sum()) - np.repeat(
+        np.cumsum(gap_lens) - gap_lens, gap_lens
+    )
+    gap_fill = np.repeat(gap_starts, gap_lens) + gap_offsets
+    fd_outliers = np.unique(np.concatenate((fd_outliers, gap_fill)))
     return fd_outliers
 
 
-def _get_file_raw(confounds_raw):
+def _get_file_raw(confounds_raw, naming_schemes):
     """Get the name of the raw confound file."""
     if "nii" in confounds_raw[-6:]:
-        suffix = "_space-" + confounds_raw.split("space-")[1]
-        confounds_raw = confounds_raw.replace(suffix, "_desc-confounds_timeseries.tsv",)
+        img = Path(confounds_raw)
+        base_stem = img.name.split("_space-")[0]
         # fmriprep has changed the file suffix between v20.1.1 and v20.2.0 with respect to BEP 012.
         # cf. https://neurostars.org/t/naming-change-confounds-regressors-to-confounds-timeseries/17637
         # Check file with new naming scheme exists or replace, for backward compatibility.
-        if not os.path.exists(confounds_raw):
-            confounds_raw = confounds_raw.replace(
-                "_desc-confounds_timeseries.tsv", "_desc-confounds_regressors.tsv",
+        # The naming scheme is only checked once per directory.
+        if img.parent not in naming_schemes:
+            new_naming = img.with_name(f"{base_stem}_desc-confounds_timeseries.tsv")
+            naming_schemes[img.parent] = (
+                "timeseries" if new_naming.exists() else "regressors"
             )
+        confounds_raw = str(
+            img.with_name(
+                f"{base_stem}_desc-confounds_{naming_schemes[img.parent]}.tsv"
+            )
+        )
     return confounds_raw
 
 
-def _get_json(confounds_raw, flag_acompcor):
-    """Load json data companion to the confounds tsv file."""
-    # Load JSON file
-    confounds_json = confounds_raw.replace("tsv", "json")
+def _parse_json(content):
+    """Parse json content, using orjson if available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is strict, e.g. it rejects the NaN values accepted by json
+            pass
+    return json.loads(content)
+
+
+def _get_json_path(confounds_raw):
+    """Get the name of the json file companion to the confounds tsv file."""
+    return str(Path(confounds_raw).with_suffix(".json"))
+
+
+def _read_json(confounds_raw):
+    """Read the raw content of the json file companion to the confounds tsv file."""
     try:
-        with open(confounds_json, "rb") as f:
-            confounds_json = json.load(f)
+        with open(_get_json_path(confounds_raw), "rb") as f:
+            return f.read()
     except OSError:
-        if flag_acompcor:
-            raise ValueError(
-                f"Could not find a json file {confounds_json}. This is necessary for anat compcor"
-            )
-    return confounds_json
+        return None
 
 
-def _confounds_to_df(confounds_raw, flag_acompcor):
-    """Load raw confounds as a pandas DataFrame."""
-    confounds_raw = _get_file_raw(confounds_raw)
-    confounds_json = _get_json(confounds_raw, flag_acompcor)
+def _get_mtime(path):
+    """Get the modification time of a file, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _read_confounds(confounds_raw, mtime, json_mtime):
+    """Read a confounds tsv file and its raw json, cached by path and mtimes."""
+    json_content = _read_json(confounds_raw)
     confounds_raw = pd.read_csv(confounds_raw, delimiter="\t", encoding="utf-8")
+    return confounds_raw, json_content
+
+
+def _confounds_to_df(confounds_raw, flag_acompcor, naming_schemes):
+    """Load raw confounds as a pandas DataFrame."""
+    confounds_raw = os.path.abspath(_get_file_raw(confounds_raw, naming_schemes))
+    mtime = os.stat(confounds_raw).st_mtime_ns
+    json_mtime = _get_mtime(_get_json_path(confounds_raw))
+    if flag_acompcor and json_mtime is None:
+        raise ValueError(
+            f"Could not find a json file {_get_json_path(confounds_raw)}. "
+            "This is necessary for anat compcor"
+        )
+    confounds_path = confounds_raw
+    confounds_raw, json_content = _read_confounds(confounds_raw, mtime, json_mtime)
+    # The json is cached as raw bytes and parsed on every call, which is cheaper
+    # than copying the parsed dict and gives each caller its own json data.
+    # If there is no json file, keep its name instead.
+    if json_content is None:
+        confounds_json = _get_json_path(confounds_path)
+    else:
+        confounds_json = _parse_json(json_content)
+    # The cached DataFrame is only read from: _load_single extracts the planned
+    # columns with list indexing, which returns a copy.
     return confounds_raw, confounds_json
 
 
+def _stack_confounds(arrays, n_scans):
+    """Stack confounds arrays column-wise into a single new array."""
+    if not arrays:
+        return np.empty((n_scans, 0))
+    # Stack in column-major order, as pandas does, so that reductions over
+    # time (e.g. demeaning) work on contiguous memory for each confound
+    return np.concatenate([arr.T for arr in arrays]).T
+
+
 def _confounds_to_ndarray(confounds, demean):
-    """Convert confounds from a pandas dataframe to a numpy array."""
-    # Convert from DataFrame to numpy ndarray
-    labels = confounds.columns
-    confounds = confounds.values
+    """Prepare the numpy array of confounds for nilearn."""
+    # Always return float64, whatever the type of the loaded confounds
+    confounds = np.asarray(confounds, dtype=np.float64)
 
     # Derivatives have NaN on the first row
     # Replace them by estimates at second time point,
     # otherwise nilearn will crash.
-    mask_nan = np.isnan(confounds[0, :])
-    confounds[0, mask_nan] = confounds[1, mask_nan]
+    np.copyto(confounds[0], confounds[1], where=np.isnan(confounds[0]))
 
     # Optionally demean confounds
     if demean:
-        confounds = scale(confounds, axis=0, with_std=False)
+        confounds -= confounds.mean(axis=0, keepdims=True)
 
-    return confounds, labels
+    return confounds
 
 
 class MissingConfound(Exception):
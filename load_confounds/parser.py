@@ -3,7 +3,7 @@
 Authors: load_confounds team
 """
 import numpy as np
-import pandas as pd
+from joblib import Parallel, delayed
 from . import confounds as cf
 from .compcor import _find_compcor
 
@@ -18,6 +18,11 @@ all_confounds = [
     "scrub",
 ]
 
+# Basic confounds, before adding suffixes
+motion_base_params = ["trans_x", "trans_y", "trans_z", "rot_x", "rot_y", "rot_z"]
+wm_csf_base_params = ["csf", "white_matter"]
+global_base_params = ["global_signal"]
+
 
 def _sanitize_strategy(strategy):
     """Defines the supported denoising strategies."""
@@ -119,6 +124,10 @@ class Confounds:
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Attributes
     ----------
     `confounds_` : ndarray
@@ -159,6 +168,7 @@ class Confounds:
         acompcor_combined=True,
         n_compcor="auto",
         demean=True,
+        n_jobs=1,
     ):
         """Default parameters."""
         self.strategy = _sanitize_strategy(strategy)
@@ -173,6 +183,7 @@ class Confounds:
         self.acompcor_combined = acompcor_combined
         self.n_compcor = n_compcor
         self.demean = demean
+        self.n_jobs = n_jobs
 
     def load(self, confounds_raw):
         """
@@ -195,8 +206,21 @@ class Confounds:
         columns_out = []
         self.missing_confounds_ = []
         self.missing_keys_ = []
-        for file in confounds_raw:
-            conf, col = self._load_single(file)
+        self._plans = {}
+        self._naming_schemes = {}
+        if len(confounds_raw) > 1 and self.n_jobs != 1:
+            loaded = Parallel(n_jobs=self.n_jobs)(
+                delayed(self._load_single)(file) for file in confounds_raw
+            )
+        else:
+            loaded = (self._load_single(file) for file in confounds_raw)
+        # Parallel jobs work on copies of self, so their state is merged here,
+        # in the same order and with the same errors as sequential loading
+        for conf, col, confounds_json, missing_confounds, missing_keys in loaded:
+            self.json_ = confounds_json
+            self.missing_confounds_ += missing_confounds
+            self.missing_keys_ += missing_keys
+            _check_error(self.missing_confounds_, self.missing_keys_)
             confounds_out.append(conf)
             columns_out.append(col)
 
@@ -211,97 +235,128 @@ class Confounds:
         return confounds_out
 
     def _load_single(self, confounds_raw):
-        """Load a single confounds file from fmriprep."""
+        """
+        Load a single confounds file from fmriprep.
+        Also returns the json and the missing params and keywords, as the
+        file may be loaded in a parallel job with a copy of self.
+        """
         # Convert tsv file to pandas dataframe
         flag_acompcor = ("compcor" in self.strategy) and (self.compcor == "anat")
-        confounds_raw, self.json_ = cf._confounds_to_df(confounds_raw, flag_acompcor)
-
-        confounds = pd.DataFrame()
-
-        for confound in self.strategy:
-            loaded_confounds = self._load_confound(confounds_raw, confound)
-            confounds = pd.concat([confounds, loaded_confounds], axis=1)
-
-        _check_error(self.missing_confounds_, self.missing_keys_)
-        confounds, labels = cf._confounds_to_ndarray(confounds, self.demean)
-        return confounds, labels
-
-    def _load_confound(self, confounds_raw, confound):
-        """Load a single type of confound."""
-        try:
-            loaded_confounds = getattr(self, f"_load_{confound}")(confounds_raw)
-        except cf.MissingConfound as exception:
-            self.missing_confounds_ += exception.params
-            self.missing_keys_ += exception.keywords
-            loaded_confounds = pd.DataFrame()
-        return loaded_confounds
-
-    def _load_motion(self, confounds_raw):
-        """Load the motion regressors."""
-        motion_params = cf._add_suffix(
-            ["trans_x", "trans_y", "trans_z", "rot_x", "rot_y", "rot_z"], self.motion
+        confounds_raw, self.json_ = cf._confounds_to_df(
+            confounds_raw, flag_acompcor, self._naming_schemes
         )
-        cf._check_params(confounds_raw, motion_params)
-        confounds_motion = confounds_raw[motion_params]
 
-        # Optionally apply PCA reduction
-        if self.n_motion > 0:
-            confounds_motion = cf._pca_motion(
-                confounds_motion, n_components=self.n_motion
+        plan, missing_confounds, missing_keys = self._plan(confounds_raw)
+        if missing_confounds or missing_keys:
+            return None, None, self.json_, missing_confounds, missing_keys
+
+        # Extract all planned columns at once, then split them by type of confound
+        planned_columns = [param for _, params in plan for param in params]
+        values = confounds_raw[planned_columns].to_numpy(copy=False)
+        arrays = []
+        labels = []
+        start = 0
+        for confound, params in plan:
+            loaded_confounds = values[:, start : start + len(params)]
+            start += len(params)
+            if confound == "scrub":
+                loaded_confounds, params = self._load_scrub(confounds_raw)
+            elif confound == "motion" and self.n_motion > 0:
+                loaded_confounds, params = cf._pca_motion(
+                    loaded_confounds, n_components=self.n_motion
+                )
+            arrays.append(loaded_confounds)
+            labels.extend(params)
+
+        confounds = cf._stack_confounds(arrays, n_scans=len(confounds_raw))
+        confounds = cf._confounds_to_ndarray(confounds, self.demean)
+        return confounds, labels, self.json_, [], []
+
+    def _plan(self, confounds_raw):
+        """
+        List the columns of each type of confound in the strategy.
+        The plan is computed once for all files sharing the same columns
+        and compcor metadata, and reset at every call to load.
+        """
+        if "compcor" in self.strategy and isinstance(self.json_, dict):
+            compcor_masks = tuple(
+                (col, meta.get("Mask"))
+                for col, meta in self.json_.items()
+                if "comp_cor" in col
             )
-        return confounds_motion
+        else:
+            compcor_masks = None
+        key = (tuple(confounds_raw.columns), compcor_masks)
+        if key not in self._plans:
+            plan = []
+            missing_confounds = []
+            missing_keys = []
+            for confound in self.strategy:
+                try:
+                    params = getattr(self, f"_params_{confound}")(confounds_raw)
+                except cf.MissingConfound as exception:
+                    missing_confounds += exception.params
+                    missing_keys += exception.keywords
+                    params = []
+                plan.append((confound, params))
+            self._plans[key] = (plan, missing_confounds, missing_keys)
+        return self._plans[key]
+
+    def _params_motion(self, confounds_raw):
+        """List the motion regressors."""
+        motion_params = cf._add_suffix(motion_base_params, self.motion)
+        cf._check_params(confounds_raw, motion_params)
+        return motion_params
 
-    def _load_high_pass(self, confounds_raw):
-        """Load the high pass filter regressors."""
-        high_pass_params = cf._find_confounds(confounds_raw, ["cosine"])
-        return confounds_raw[high_pass_params]
+    def _params_high_pass(self, confounds_raw):
+        """List the high pass filter regressors."""
+        return cf._find_confounds(confounds_raw, ["cosine"])
 
-    def _load_wm_csf(self, confounds_raw):
-        """Load the regressors derived from the white matter and CSF masks."""
-        wm_csf_params = cf._add_suffix(["csf", "white_matter"], self.wm_csf)
+    def _params_wm_csf(self, confounds_raw):
+        """List the regressors derived from the white matter and CSF masks."""
+        wm_csf_params = cf._add_suffix(wm_csf_base_params, self.wm_csf)
         cf._check_params(confounds_raw, wm_csf_params)
-        return confounds_raw[wm_csf_params]
+        return wm_csf_params
 
-    def _load_global(self, confounds_raw):
-        """Load the regressors derived from the global signal."""
-        global_params = cf._add_suffix(["global_signal"], self.global_signal)
+    def _params_global(self, confounds_raw):
+        """List the regressors derived from the global signal."""
+        global_params = cf._add_suffix(global_base_params, self.global_signal)
         cf._check_params(confounds_raw, global_params)
-        return confounds_raw[global_params]
+        return global_params
 
-    def _load_compcor(self, confounds_raw):
-        """Load compcor regressors."""
+    def _params_compcor(self, confounds_raw):
+        """List the compcor regressors."""
         compcor_cols = _find_compcor(
             self.json_, self.compcor, self.n_compcor, self.acompcor_combined
         )
         cf._check_params(confounds_raw, compcor_cols)
-        return confounds_raw[compcor_cols]
+        return compcor_cols
+
+    def _params_ica_aroma(self, confounds_raw):
+        """List the ICA-AROMA regressors."""
+        return cf._find_confounds(confounds_raw, ["aroma"])
 
-    def _load_ica_aroma(self, confounds_raw):
-        """Load the ICA-AROMA regressors."""
-        ica_aroma_params = cf._find_confounds(confounds_raw, ["aroma"])
-        return confounds_raw[ica_aroma_params]
+    def _params_scrub(self, confounds_raw):
+        """Scrub regressors are built from fd and dvars in _load_scrub."""
+        return []
 
     def _load_scrub(self, confounds_raw):
         """Perform basic scrub - Remove volumes if framewise displacement exceeds threshold."""
         n_scans = len(confounds_raw)
-        # Get indices of fd outliers
-        fd_outliers = np.where(
-            confounds_raw["framewise_displacement"] > self.fd_thresh
-        )[0]
-        dvars_outliers = np.where(confounds_raw["std_dvars"] > self.std_dvars_thresh)[0]
-        combined_outliers = np.sort(
-            np.unique(np.concatenate((fd_outliers, dvars_outliers)))
-        )
+        # Get indices of fd or dvars outliers, sorted and unique by construction
+        # NaN values (first time point) are never flagged as outliers
+        fd = confounds_raw["framewise_displacement"].to_numpy()
+        dvars = confounds_raw["std_dvars"].to_numpy()
+        with np.errstate(invalid="ignore"):
+            combined_outliers = np.flatnonzero(
+                (fd > self.fd_thresh) | (dvars > self.std_dvars_thresh)
+            )
         # Do full scrubbing if desired, and motion outliers were detected
         if self.scrub == "full" and len(combined_outliers) > 0:
             combined_outliers = cf._optimize_scrub(combined_outliers, n_scans)
         # Make one-hot encoded motion outlier regressors
-        motion_outlier_regressors = pd.DataFrame(
-            np.transpose(np.eye(n_scans)[combined_outliers]).astype(int)
-        )
-        column_names = [
-            "motion_outlier_" + str(num)
-            for num in range(np.shape(motion_outlier_regressors)[1])
-        ]
-        motion_outlier_regressors.columns = column_names
-        return motion_outlier_regressors
+        n_outliers = len(combined_outliers)
+        motion_outlier_regressors = np.zeros((n_scans, n_outliers), dtype=np.int8)
+        motion_outlier_regressors[combined_outliers, np.arange(n_outliers)] = 1
+        column_names = ["motion_outlier_" + str(num) for num in range(n_outliers)]
+        return motion_outlier_regressors, column_names
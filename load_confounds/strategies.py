@@ -21,6 +21,10 @@ class Params2(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -28,11 +32,12 @@ class Params2(Confounds):
 
     """
 
-    def __init__(self, demean=True):
+    def __init__(self, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["high_pass", "wm_csf"]
         self.wm_csf = "basic"
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class Params6(Confounds):
@@ -51,6 +56,10 @@ class Params6(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -58,12 +67,13 @@ class Params6(Confounds):
 
     """
 
-    def __init__(self, demean=True):
+    def __init__(self, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["high_pass", "motion"]
         self.motion = "basic"
         self.n_motion = 0
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class Params9(Confounds):
@@ -82,6 +92,10 @@ class Params9(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -89,7 +103,7 @@ class Params9(Confounds):
 
     """
 
-    def __init__(self, demean=True):
+    def __init__(self, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["high_pass", "motion", "wm_csf", "global"]
         self.motion = "basic"
@@ -97,6 +111,7 @@ class Params9(Confounds):
         self.wm_csf = "basic"
         self.global_signal = "basic"
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class Params9Scrub(Confounds):
@@ -121,6 +136,10 @@ class Params9Scrub(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -128,7 +147,7 @@ class Params9Scrub(Confounds):
 
     """
 
-    def __init__(self, fd_thresh=0.2, std_dvars_thresh=3, demean=True):
+    def __init__(self, fd_thresh=0.2, std_dvars_thresh=3, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["high_pass", "motion", "wm_csf", "scrub"]
         self.motion = "basic"
@@ -138,6 +157,7 @@ class Params9Scrub(Confounds):
         self.fd_thresh = (fd_thresh,)
         self.std_dvars_thresh = (std_dvars_thresh,)
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class Params24(Confounds):
@@ -157,6 +177,10 @@ class Params24(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -164,12 +188,13 @@ class Params24(Confounds):
 
     """
 
-    def __init__(self, demean=True):
+    def __init__(self, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["high_pass", "motion"]
         self.motion = "full"
         self.n_motion = 0
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class Params36(Confounds):
@@ -190,6 +215,10 @@ class Params36(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -197,7 +226,7 @@ class Params36(Confounds):
 
     """
 
-    def __init__(self, demean=True):
+    def __init__(self, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["high_pass", "motion", "wm_csf", "global"]
         self.motion = "full"
@@ -205,6 +234,7 @@ class Params36(Confounds):
         self.wm_csf = "full"
         self.global_signal = "full"
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class Params36Scrub(Confounds):
@@ -231,6 +261,10 @@ class Params36Scrub(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -238,7 +272,7 @@ class Params36Scrub(Confounds):
 
     """
 
-    def __init__(self, fd_thresh=0.2, std_dvars_thresh=3, demean=True):
+    def __init__(self, fd_thresh=0.2, std_dvars_thresh=3, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["high_pass", "motion", "wm_csf", "scrub"]
         self.motion = "full"
@@ -248,6 +282,7 @@ class Params36Scrub(Confounds):
         self.fd_thresh = (fd_thresh,)
         self.std_dvars_thresh = (std_dvars_thresh,)
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class AnatCompCor(Confounds):
@@ -276,6 +311,10 @@ class AnatCompCor(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -283,7 +322,9 @@ class AnatCompCor(Confounds):
 
     """
 
-    def __init__(self, n_compcor="auto", demean=True, acompcor_combined=True):
+    def __init__(
+        self, n_compcor="auto", demean=True, acompcor_combined=True, n_jobs=1
+    ):
         """Default parameters."""
         self.strategy = ["high_pass", "motion", "compcor"]
         self.motion = "full"
@@ -292,6 +333,7 @@ class AnatCompCor(Confounds):
         self.n_compcor = n_compcor
         self.acompcor_combined = acompcor_combined
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class TempCompCor(Confounds):
@@ -314,6 +356,10 @@ class TempCompCor(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -321,13 +367,14 @@ class TempCompCor(Confounds):
 
     """
 
-    def __init__(self, n_compcor="auto", demean=True):
+    def __init__(self, n_compcor="auto", demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["high_pass", "compcor"]
         self.compcor = "temp"
         self.n_compcor = n_compcor
         self.acompcor_combined = None
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class ICAAROMA(Confounds):
@@ -370,6 +417,10 @@ class ICAAROMA(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -387,10 +438,11 @@ class ICAAROMA(Confounds):
 
     """
 
-    def __init__(self, demean=True):
+    def __init__(self, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["wm_csf", "high_pass"]
         self.demean = demean
+        self.n_jobs = n_jobs
         self.wm_csf = "basic"
 
 
@@ -434,6 +486,10 @@ class AROMAGSR(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -451,12 +507,13 @@ class AROMAGSR(Confounds):
 
     """
 
-    def __init__(self, demean=True):
+    def __init__(self, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["wm_csf", "high_pass", "global"]
         self.global_signal = "basic"
         self.wm_csf = "basic"
         self.demean = demean
+        self.n_jobs = n_jobs
 
 
 class AggrICAAROMA(Confounds):
@@ -489,6 +546,10 @@ class AggrICAAROMA(Confounds):
         using nilearn with no or zscore standardization, but should be turned off
         with "spc" normalization.
 
+    n_jobs : int, optional
+        Number of jobs used to load a list of confounds files in parallel.
+        Default is 1 (no parallel loading). -1 means using all processors.
+
     Returns
     -------
     conf :  a Confounds object
@@ -501,9 +562,10 @@ class AggrICAAROMA(Confounds):
 
     """
 
-    def __init__(self, demean=True):
+    def __init__(self, demean=True, n_jobs=1):
         """Default parameters."""
         self.strategy = ["wm_csf", "high_pass", "global", "ica_aroma"]
         self.global_signal = "basic"
         self.wm_csf = "basic"
         self.demean = demean
+        self.n_jobs = n_jobs
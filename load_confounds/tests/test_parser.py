@@ -1,5 +1,6 @@
 import os
 import re
+from pathlib import Path
 import load_confounds.parser as lc
 import pandas as pd
 import numpy as np
@@ -197,6 +198,124 @@ def test_confounds2df():
     assert "trans_x" in conf.columns_
 
 
+def test_confounds2df_timeseries(tmp_path):
+    """Check auto-detect of confounds with the fMRIprep >= 20.2.0 naming scheme."""
+    file_timeseries = tmp_path / "sub-01_desc-confounds_timeseries.tsv"
+    file_timeseries.write_text(Path(file_confounds).read_text())
+    file_nii = tmp_path / "sub-01_space-MNI152NLin2009cAsym_desc-preproc_bold.nii.gz"
+    conf_nii = lc.Confounds(strategy=["motion"])
+    conf_nii.load(str(file_nii))
+    conf_tsv = lc.Confounds(strategy=["motion"])
+    conf_tsv.load(file_confounds)
+    assert conf_nii.columns_ == conf_tsv.columns_
+    assert np.array_equal(conf_nii.confounds_, conf_tsv.confounds_)
+
+
+def test_confounds2df_tsv_directory(tmp_path):
+    """Check that the json is found in a directory with "tsv" in its name."""
+    path_study = tmp_path / "my_tsv_study"
+    path_study.mkdir()
+    file_json = file_confounds.replace(".tsv", ".json")
+    (path_study / Path(file_confounds).name).write_text(
+        Path(file_confounds).read_text()
+    )
+    (path_study / Path(file_json).name).write_text(Path(file_json).read_text())
+    for compcor in ["anat", "temp"]:
+        conf_study = lc.Confounds(strategy=["compcor"], compcor=compcor)
+        conf_study.load(str(path_study / Path(file_confounds).name))
+        conf = lc.Confounds(strategy=["compcor"], compcor=compcor)
+        conf.load(file_confounds)
+        assert conf_study.columns_
+        assert conf_study.columns_ == conf.columns_
+
+
+def test_confounds2df_cache():
+    """Check that comparing strategies on the same file parses it only once."""
+    lc.cf._read_confounds.cache_clear()
+    for strategy in [["motion"], ["wm_csf"], ["motion", "wm_csf"], ["high_pass"]]:
+        lc.Confounds(strategy=strategy).load(file_confounds)
+    cache_info = lc.cf._read_confounds.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 3
+
+
+def test_confounds2df_cache_copy():
+    """Check that the cached confounds cannot be modified by callers."""
+    conf = lc.Confounds(strategy=["compcor"])
+    conf.load(file_confounds)
+    n_compcor = len(conf.columns_)
+    conf.json_.clear()
+    conf.load(file_confounds)
+    assert len(conf.columns_) == n_compcor
+
+
+def test_confounds2df_json_mtime(tmp_path):
+    """Check that editing the json file invalidates the cache."""
+    file_tsv = tmp_path / "sub-01_desc-confounds_timeseries.tsv"
+    file_json = tmp_path / "sub-01_desc-confounds_timeseries.json"
+    file_tsv.write_text(Path(file_confounds).read_text())
+    file_json.write_text(Path(file_confounds.replace("tsv", "json")).read_text())
+    conf = lc.Confounds(strategy=["compcor"], compcor="temp")
+    conf.load(str(file_tsv))
+    assert "t_comp_cor_00" in conf.columns_
+    file_json.write_text("{}")
+    # make sure the modification time changes, even on coarse file systems
+    stat = os.stat(file_json)
+    os.utime(file_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    conf.load(str(file_tsv))
+    assert conf.columns_ == []
+
+
+def test_n_jobs():
+    """Check that loading files in parallel matches sequential loading."""
+    files = [file_confounds, file_confounds]
+    conf_seq = lc.Confounds(strategy=["motion", "high_pass"]).load(files)
+    conf_par = lc.Confounds(strategy=["motion", "high_pass"], n_jobs=2).load(files)
+    assert len(conf_par) == 2
+    for seq, par in zip(conf_seq, conf_par):
+        assert np.array_equal(seq, par)
+
+
+def test_n_jobs_state():
+    """Check that parallel loading sets the same attributes as sequential loading."""
+    files = [file_confounds, file_confounds]
+    conf = lc.Confounds(strategy=["compcor"], n_jobs=2)
+    conf.load(files)
+    assert "a_comp_cor_00" in conf.json_
+
+    file_missing_confounds = os.path.join(
+        path_data, "missing_space-MNI152NLin2009cAsym_desc-preproc_bold.nii.gz"
+    )
+    files = [file_confounds, file_missing_confounds]
+    conf_seq = lc.Confounds(strategy=["high_pass", "motion"])
+    conf_par = lc.Confounds(strategy=["high_pass", "motion"], n_jobs=2)
+    for conf in [conf_seq, conf_par]:
+        with pytest.raises(ValueError):
+            conf.load(files)
+    assert conf_par.missing_confounds_
+    assert conf_par.missing_confounds_ == conf_seq.missing_confounds_
+    assert conf_par.missing_keys_ == conf_seq.missing_keys_
+
+
+def test_plan():
+    """Check that the columns are planned once for files with the same columns."""
+    conf = lc.Confounds(strategy=["motion", "high_pass", "compcor"])
+    conf.load([file_confounds, file_confounds])
+    assert len(conf._plans) == 1
+    for _, params in next(iter(conf._plans.values()))[0]:
+        assert params
+        assert all(param in conf.columns_[0] for param in params)
+
+
+def test_parse_json():
+    """Check that json content is parsed, including non-strict NaN values."""
+    assert lc.cf._parse_json(b'{"a_comp_cor_00": {"Mask": "CSF"}}') == {
+        "a_comp_cor_00": {"Mask": "CSF"}
+    }
+    confounds_json = lc.cf._parse_json(b'{"VarianceExplained": NaN}')
+    assert np.isnan(confounds_json["VarianceExplained"])
+
+
 def test_sanitize_strategy():
     """Check that flawed strategy options generate meaningful error messages."""
     with pytest.raises(ValueError):
@@ -267,11 +386,60 @@ def test_n_motion():
     conf.load(file_confounds)
     assert "motion_pca_6" in conf.columns_
 
+    conf = lc.Confounds(strategy=["motion"], motion="full", n_motion=3)
+    conf.load(file_confounds)
+    assert "motion_pca_3" in conf.columns_
+    assert "motion_pca_4" not in conf.columns_
+
+    # one row per time point, also when combined with other confounds
+    conf = lc.Confounds(strategy=["motion", "high_pass"], motion="full", n_motion=3)
+    conf.load(file_confounds)
+    assert conf.confounds_.shape[0] == pd.read_csv(file_confounds, sep="\t").shape[0]
+    assert not np.isnan(conf.confounds_).any()
+
+    # the PCA runs in float32, but confounds are returned as float64
+    for demean in [True, False]:
+        conf = lc.Confounds(strategy=["motion"], n_motion=3, demean=demean)
+        conf.load(file_confounds)
+        assert conf.confounds_.dtype == np.float64
+
     with pytest.raises(ValueError):
         conf = lc.Confounds(strategy=["motion"], motion="full", n_motion=50)
         conf.load(file_confounds)
 
 
+def test_optimize_scrub():
+    """Check that short segments are scrubbed at the edges and in between."""
+    fd_outliers = np.array([2, 10, 13, 20, 27])
+    expected = [0, 1, 2, 10, 11, 12, 13, 20, 27, 28, 29]
+    scrubbed = lc.cf._optimize_scrub(fd_outliers, n_scans=30)
+    assert np.array_equal(scrubbed, expected)
+    # the numpy implementation is used when numba is not available
+    scrubbed = lc.cf._optimize_scrub_np(fd_outliers, n_scans=30)
+    assert np.array_equal(scrubbed, expected)
+
+
+def test_scrub_dtype():
+    """Check that scrub regressors are returned as float64."""
+    for demean in [True, False]:
+        conf = lc.Confounds(strategy=["scrub"], fd_thresh=0.15, demean=demean)
+        conf.load(file_confounds)
+        assert conf.confounds_.dtype == np.float64
+
+
+def test_scrub_threshold_precision():
+    """Check that frames just above the threshold are flagged as outliers."""
+    conf = lc.Confounds(strategy=["scrub"], scrub="basic", fd_thresh=0.2)
+    confounds_raw = pd.DataFrame(
+        {
+            "framewise_displacement": [np.nan, 0.20000001, 0.1],
+            "std_dvars": [np.nan, 0.5, 0.5],
+        }
+    )
+    _, labels = conf._load_scrub(confounds_raw)
+    assert labels == ["motion_outlier_0"]
+
+
 def test_not_found_exception():
 
     conf = lc.Confounds(
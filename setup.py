@@ -29,6 +29,7 @@ setup(
         "pandas>=0.25.3",
         "scikit-learn>=0.21.3",
         "scipy>=1.3.2",
+        "joblib>=0.14",
         "nilearn>=0.7.1",
     ],  # external packages as dependencies
     classifiers=[